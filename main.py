@@ -1,1606 +1,1415 @@
-#!/usr/bin/env python3
-"""
-BIMALISM SERVER with Simplified Hamburger Menu
-Features:
-1. Hamburger menu in top-right corner
-2. Opens sidebar with ONLY requested items
-3. Tracks coins and study time on server
-4. Clean header without original navigation
-"""
-
-import http.server
-import socketserver
-import webbrowser
-import os
-import json
-import time
-from urllib.parse import urlparse, parse_qs
-import mimetypes
-from datetime import datetime
-
-PORT = 8080
-DATA_FILE = 'bimalism_data.json'
-
-# Initialize MIME types
-mimetypes.init()
-mimetypes.add_type('application/javascript', '.js')
-mimetypes.add_type('text/css', '.css')
-
-class BimalismServer(http.server.SimpleHTTPRequestHandler):
-    """Server handler with simplified hamburger menu"""
-    
-    def do_GET(self):
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        
-        print(f"📱 Request: {path}")
-        
-        # API endpoints
-        if path == '/api/get_coins':
-            self.get_coins_data()
-            return
-        elif path == '/api/get_timer':
-            self.get_timer_data()
-            return
-        elif path.startswith('/api/update_coins'):
-            self.update_coins()
-            return
-        
-        # Serve HTML pages with menu
-        if path == '/' or path == '/index.html':
-            self.serve_homepage()
-        elif path in ['/neet', '/neet.html']:
-            self.serve_page_with_menu('neet.html', 'NEET Preparation')
-        elif path in ['/jee', '/jee.html']:
-            self.serve_page_with_menu('jee.html', 'JEE Preparation')
-        elif path in ['/game', '/g.html']:
-            self.serve_page_with_menu('g.html', 'Educational Games')
-        elif path in ['/settings', '/settings.html']:
-            self.serve_page_with_menu('settings.html', 'Settings')
-        elif path in ['/tips', '/tips.html']:
-            self.serve_page_with_menu('tips.html', 'Study Tips')
-        elif path in ['/table', '/table.html']:
-            self.serve_page_with_menu('table.html', 'Study Resources')
-        elif path in ['/calculator', '/calculator.html']:
-            self.serve_page_with_menu('calculator.html', 'Calculator')
-        elif path in ['/bio-data-pop-up', '/bio-data-pop-up.html']:
-            self.serve_page_with_menu('bio-data-pop-up.html', 'Student Profile')
-        elif path in ['/registration', '/registration.html']:
-            self.serve_registration_page()
-        elif path == '/h.html':
-            self.serve_page_with_menu('h.html', 'हिंदी')
-        elif path == '/t.html':
-            self.serve_page_with_menu('t.html', 'தமிழ்')
-        else:
-            # Try to serve static files
-            self.serve_static_file(path)
-    
-    def serve_homepage(self):
-        """Serve homepage with clean header and hamburger menu"""
-        try:
-            # Load data
-            data = self.load_data()
-            user_coins = data.get('coins', 0)
-            study_time = data.get('study_time', 0)
-            
-            # Read original HTML
-            with open('index.html', 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Find header and replace with clean version
-            if '<header>' in html_content and '</header>' in html_content:
-                header_start = html_content.find('<header>')
-                header_end = html_content.find('</header>') + 9
-                header = html_content[header_start:header_end]
-                
-                # Replace the entire header with our clean version
-                clean_header = self.generate_clean_header()
-                html_content = html_content.replace(header, clean_header)
-            else:
-                # If no header found, add clean header at top
-                clean_header = self.generate_clean_header()
-                if '<body>' in html_content:
-                    html_content = html_content.replace('<body>', '<body>' + clean_header)
-            
-            # Add sidebar menu HTML (always at end of body)
-            sidebar_html = self.generate_sidebar_menu(user_coins)
-            
-            # Add JavaScript for menu functionality
-            js_injection = f'''
-            <!-- Menu JavaScript -->
-            {sidebar_html}
-            <script>
-            // Hamburger Menu Toggle
-            const hamburgerBtn = document.getElementById('hamburgerBtn');
-            const sidebarMenu = document.getElementById('sidebarMenu');
-            const overlay = document.getElementById('overlay');
-            const closeMenuBtn = document.getElementById('closeMenuBtn');
-            
-            function openMenu() {{
-                sidebarMenu.classList.add('active');
-                overlay.classList.add('active');
-                document.body.style.overflow = 'hidden';
-            }}
-            
-            function closeMenu() {{
-                sidebarMenu.classList.remove('active');
-                overlay.classList.remove('active');
-                document.body.style.overflow = 'auto';
-            }}
-            
-            if (hamburgerBtn) {{
-                hamburgerBtn.addEventListener('click', openMenu);
-            }}
-            
-            if (closeMenuBtn) {{
-                closeMenuBtn.addEventListener('click', closeMenu);
-            }}
-            
-            if (overlay) {{
-                overlay.addEventListener('click', closeMenu);
-            }}
-            
-            // Close menu when clicking on menu items
-            const menuItems = document.querySelectorAll('.menu-item');
-            menuItems.forEach(item => {{
-                item.addEventListener('click', function(e) {{
-                    // Only close for internal links
-                    if (this.getAttribute('href') && !this.getAttribute('href').startsWith('#')) {{
-                        closeMenu();
-                    }}
-                }});
-            }});
-            
-            // Close menu with Escape key
-            document.addEventListener('keydown', function(e) {{
-                if (e.key === 'Escape') closeMenu();
-            }});
-            
-            // Load coin data from server
-            function loadCoinData() {{
-                fetch('/api/get_coins')
-                    .then(response => response.json())
-                    .then(data => {{
-                        // Update coin counter in menu
-                        const coinBadge = document.querySelector('.menu-badge');
-                        if (coinBadge) {{
-                            coinBadge.textContent = data.coins + ' coins';
-                        }}
-                        
-                        // Update coin display in menu header
-                        const coinDisplay = document.querySelector('.user-coins');
-                        if (coinDisplay) {{
-                            coinDisplay.textContent = data.coins + ' Coins';
-                        }}
-                    }})
-                    .catch(error => console.error('Error loading coin data:', error));
-            }}
-            
-            // Load every 30 seconds
-            setInterval(loadCoinData, 30000);
-            
-            // Initial load
-            loadCoinData();
-            </script>
-            '''
-            
-            # Inject JavaScript before closing body tag
-            if '</body>' in html_content:
-                html_content = html_content.replace('</body>', js_injection + '\n</body>')
-            else:
-                html_content += js_injection
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(html_content.encode('utf-8'))
-            
-        except Exception as e:
-            print(f"Error serving homepage: {e}")
-            self.send_error(500, f"Internal Server Error: {str(e)}")
-    
-    def serve_registration_page(self):
-        """Serve registration page with timer and coin tracking"""
-        try:
-            # Load data
-            data = self.load_data()
-            user_coins = data.get('coins', 0)
-            study_time = data.get('study_time', 0)
-            study_hours = study_time // 3600
-            study_minutes = (study_time % 3600) // 60
-            
-            # Create enhanced registration page
-            registration_html = self.generate_registration_page(user_coins, study_hours, study_minutes)
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(registration_html.encode('utf-8'))
-            
-        except Exception as e:
-            print(f"Error serving registration page: {e}")
-            self.send_error(500, f"Internal Server Error: {str(e)}")
-    
-    def serve_page_with_menu(self, filename, title):
-        """Serve any page with menu navigation"""
-        try:
-            if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                # Wrap in app layout with menu
-                wrapped_content = self.wrap_in_app_layout(html_content, title)
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html; charset=utf-8')
-                self.end_headers()
-                self.wfile.write(wrapped_content.encode('utf-8'))
-            else:
-                # Create default page
-                default_content = f'''
-                <div style="padding: 2rem; text-align: center;">
-                    <h1 style="color: #2563eb;">{title}</h1>
-                    <p>This page is under construction.</p>
-                    <a href="/" style="display: inline-block; margin-top: 1rem; padding: 0.8rem 1.5rem; background: #2563eb; color: white; border-radius: 25px; text-decoration: none;">
-                        ← Back to Home
-                    </a>
-                </div>
-                '''
-                wrapped_content = self.wrap_in_app_layout(default_content, title)
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html; charset=utf-8')
-                self.end_headers()
-                self.wfile.write(wrapped_content.encode('utf-8'))
-                
-        except Exception as e:
-            print(f"Error serving {filename}: {e}")
-            self.send_error(404, f"Page not found: {filename}")
-    
-    def serve_static_file(self, path):
-        """Serve static files"""
-        try:
-            filepath = '.' + path
-            if not os.path.exists(filepath):
-                self.send_error(404, "File not found")
-                return
-            
-            # Determine MIME type
-            if path.endswith('.css'):
-                mimetype = 'text/css'
-            elif path.endswith('.js'):
-                mimetype = 'application/javascript'
-            elif path.endswith('.png'):
-                mimetype = 'image/png'
-            elif path.endswith('.jpg') or path.endswith('.jpeg'):
-                mimetype = 'image/jpeg'
-            elif path.endswith('.html'):
-                mimetype = 'text/html'
-            else:
-                mimetype = 'text/plain'
-            
-            with open(filepath, 'rb') as f:
-                content = f.read()
-            
-            self.send_response(200)
-            self.send_header('Content-type', mimetype)
-            self.send_header('Content-Length', str(len(content)))
-            self.end_headers()
-            self.wfile.write(content)
-            
-        except Exception as e:
-            self.send_error(404, f"File not found: {str(e)}")
-    
-    def do_POST(self):
-        """Handle POST requests for updating coins"""
-        if self.path.startswith('/api/update_coins'):
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            
-            try:
-                # Parse the data
-                data = json.loads(post_data.decode('utf-8'))
-                
-                # Load existing data
-                server_data = self.load_data()
-                
-                if data.get('action') == 'add_coin':
-                    # Add coin from study time
-                    study_seconds = data.get('study_seconds', 0)
-                    new_coins = study_seconds // 7200  # 2 hours = 7200 seconds = 1 coin
-                    
-                    # Update server data
-                    server_data['coins'] = server_data.get('coins', 0) + new_coins
-                    server_data['study_time'] = server_data.get('study_time', 0) + study_seconds
-                    server_data['last_updated'] = datetime.now().isoformat()
-                    
-                    # Save data
-                    self.save_data(server_data)
-                    
-                    response = {
-                        'success': True,
-                        'coins': server_data['coins'],
-                        'study_time': server_data['study_time'],
-                        'coins_added': new_coins
-                    }
-                    
-                elif data.get('action') == 'update_timer':
-                    # Update study time
-                    study_seconds = data.get('study_seconds', 0)
-                    server_data['study_time'] = server_data.get('study_time', 0) + study_seconds
-                    server_data['last_updated'] = datetime.now().isoformat()
-                    
-                    # Recalculate coins
-                    server_data['coins'] = server_data['study_time'] // 7200
-                    
-                    # Save data
-                    self.save_data(server_data)
-                    
-                    response = {
-                        'success': True,
-                        'coins': server_data['coins'],
-                        'study_time': server_data['study_time']
-                    }
-                    
-                else:
-                    response = {'success': False, 'error': 'Unknown action'}
-                    
-            except Exception as e:
-                response = {'success': False, 'error': str(e)}
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
-        else:
-            self.send_error(404, "Not Found")
-    
-    def get_coins_data(self):
-        """API: Get coins data"""
-        data = self.load_data()
-        response = {
-            'coins': data.get('coins', 0),
-            'study_time': data.get('study_time', 0),
-            'last_updated': data.get('last_updated', '')
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
-    
-    def get_timer_data(self):
-        """API: Get timer data"""
-        data = self.load_data()
-        response = {
-            'study_time': data.get('study_time', 0),
-            'coins': data.get('coins', 0)
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
-    
-    def update_coins(self):
-        """API: Update coins via GET (for testing)"""
-        parsed_path = urlparse(self.path)
-        query_params = parse_qs(parsed_path.query)
-        
-        try:
-            data = self.load_data()
-            
-            if 'add' in query_params:
-                coins_to_add = int(query_params['add'][0])
-                data['coins'] = data.get('coins', 0) + coins_to_add
-                data['last_updated'] = datetime.now().isoformat()
-                self.save_data(data)
-                
-                response = {
-                    'success': True,
-                    'coins': data['coins'],
-                    'added': coins_to_add
-                }
-            else:
-                response = {'success': False, 'error': 'No add parameter'}
-                
-        except Exception as e:
-            response = {'success': False, 'error': str(e)}
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
-    
-    def load_data(self):
-        """Load data from JSON file"""
-        if os.path.exists(DATA_FILE):
-            try:
-                with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {'coins': 0, 'study_time': 0, 'last_updated': datetime.now().isoformat()}
-    
-    def save_data(self, data):
-        """Save data to JSON file"""
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-    
-    def generate_clean_header(self):
-        """Generate clean header with only logo and hamburger menu"""
-        return '''<header>
-    <div class="container">
-        <nav>
-            <div class="logo">
-                <span>Bimalism</span>
-            </div>
-            
-            <!-- Hamburger Menu Button (Top-Right) -->
-            <div class="hamburger-menu-container">
-                <button class="hamburger-btn" id="hamburgerBtn">
-                    <span></span>
-                    <span></span>
-                    <span></span>
-                </button>
-            </div>
-        </nav>
-    </div>
-    
-    <!-- Hamburger Menu Styles -->
-    <style>
-        /* Header Styles */
-        header {
-            background: linear-gradient(135deg, #2563eb, #4f46e5);
-            color: white;
-            padding: 1rem 0;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 1.5rem;
-        }
-        
-        nav {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .logo {
-            font-size: 1.8rem;
-            font-weight: 700;
-            color: white;
-        }
-        
-        .logo span {
-            background: linear-gradient(135deg, #fbbf24, #f59e0b);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        /* Hamburger Menu Container */
-        .hamburger-menu-container {
-            display: flex;
-            align-items: center;
-        }
-        
-        /* Hamburger Button */
-        .hamburger-btn {
-            background: rgba(255, 255, 255, 0.15);
-            border: none;
-            width: 44px;
-            height: 44px;
-            border-radius: 12px;
-            cursor: pointer;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-            padding: 8px;
-            position: relative;
-            z-index: 1001;
-            transition: all 0.3s ease;
-        }
-        
-        .hamburger-btn:hover {
-            background: rgba(255, 255, 255, 0.25);
-            transform: rotate(90deg);
-        }
-        
-        .hamburger-btn span {
-            display: block;
-            width: 22px;
-            height: 2px;
-            background: white;
-            border-radius: 1px;
-            margin: 2px 0;
-            transition: all 0.3s ease;
-        }
-        
-        .hamburger-btn:hover span {
-            background: #fbbf24;
-        }
-        
-        @media (max-width: 768px) {
-            .hamburger-btn {
-                width: 40px;
-                height: 40px;
-            }
-            
-            .logo {
-                font-size: 1.5rem;
-            }
-        }
-    </style>
-</header>'''
-    
-    def generate_sidebar_menu(self, user_coins=0):
-        """Generate sidebar menu with ONLY requested items"""
-        return f'''
-        <!-- Sidebar Menu (Left Side) -->
-        <div class="sidebar-menu" id="sidebarMenu">
-            <div class="sidebar-header">
-                <div class="user-profile">
-                    <div class="user-avatar">
-                        <i class="fas fa-user-graduate"></i>
-                    </div>
-                    <div class="user-info">
-                        <h3>Bimalism</h3>
-                        <p class="user-coins">{user_coins} Coins</p>
-                        <p>Education Portal</p>
-                    </div>
-                    <button class="close-menu-btn" id="closeMenuBtn">
-                        <i class="fas fa-times"></i>
-                    </button>
-                </div>
-            </div>
-            
-            <div class="sidebar-content">
-                <!-- ONLY REQUESTED ITEMS -->
-                <div class="menu-section">
-                    <h4>Navigation</h4>
-                    
-                    <a href="/" class="menu-item">
-                        <i class="fas fa-home"></i>
-                        <span>Home</span>
-                    </a>
-                    
-                    <a href="/bio-data-pop-up" class="menu-item">
-                        <i class="fas fa-user-circle"></i>
-                        <span>Bio Data</span>
-                    </a>
-                    
-                    <a href="#features" class="menu-item">
-                        <i class="fas fa-star"></i>
-                        <span>Features</span>
-                    </a>
-                    
-                    <a href="/neet" class="menu-item">
-                        <i class="fas fa-stethoscope"></i>
-                        <span>NEET</span>
-                    </a>
-                    
-                    <a href="/jee" class="menu-item">
-                        <i class="fas fa-calculator"></i>
-                        <span>JEE</span>
-                    </a>
-                    
-                    <a href="#results" class="menu-item">
-                        <i class="fas fa-chart-line"></i>
-                        <span>Results</span>
-                    </a>
-                    
-                    <a href="#testimonials" class="menu-item">
-                        <i class="fas fa-comments"></i>
-                        <span>Testimonials</span>
-                    </a>
-                    
-                    <a href="/game" class="menu-item">
-                        <i class="fas fa-gamepad"></i>
-                        <span>Game</span>
-                    </a>
-                </div>
-                
-                <!-- Additional Useful Pages -->
-                <div class="menu-section">
-                    <h4>Study Tools</h4>
-                    
-                    <a href="/registration" class="menu-item">
-                        <i class="fas fa-trophy"></i>
-                        <span>Study Challenge</span>
-                        <span class="menu-badge">{user_coins} coins</span>
-                    </a>
-                    
-                    <a href="/table" class="menu-item">
-                        <i class="fas fa-book"></i>
-                        <span>Study Resources</span>
-                    </a>
-                    
-                    <a href="/calculator" class="menu-item">
-                        <i class="fas fa-calculator"></i>
-                        <span>Calculator</span>
-                    </a>
-                </div>
-                
-                <!-- App Settings -->
-                <div class="menu-section">
-                    <h4>Settings</h4>
-                    
-                    <a href="/settings" class="menu-item">
-                        <i class="fas fa-cog"></i>
-                        <span>Settings</span>
-                    </a>
-                    
-                    <a href="#download-section" class="menu-item">
-                        <i class="fas fa-download"></i>
-                        <span>Download App</span>
-                    </a>
-                </div>
-            </div>
-            
-            <div class="sidebar-footer">
-                <p>Bimalism Education Platform</p>
-                <p>© 2024 All rights reserved</p>
-            </div>
-        </div>
-        
-        <!-- Overlay -->
-        <div class="overlay" id="overlay"></div>
-        
-        <!-- Sidebar Menu Styles -->
-        <style>
-            /* Sidebar Menu */
-            .sidebar-menu {{
-                position: fixed;
-                top: 0;
-                left: -350px;
-                width: 320px;
-                height: 100vh;
-                background: white;
-                box-shadow: 2px 0 15px rgba(0, 0, 0, 0.1);
-                z-index: 1000;
-                transition: left 0.3s ease;
-                display: flex;
-                flex-direction: column;
-                overflow: hidden;
-            }}
-            
-            .sidebar-menu.active {{
-                left: 0;
-            }}
-            
-            /* Overlay */
-            .overlay {{
-                position: fixed;
-                top: 0;
-                left: 0;
-                width: 100%;
-                height: 100%;
-                background: rgba(0, 0, 0, 0.5);
-                z-index: 999;
-                opacity: 0;
-                visibility: hidden;
-                transition: all 0.3s ease;
-            }}
-            
-            .overlay.active {{
-                opacity: 1;
-                visibility: visible;
-            }}
-            
-            /* Sidebar Header */
-            .sidebar-header {{
-                background: linear-gradient(135deg, #2563eb, #4f46e5);
-                color: white;
-                padding: 1.5rem;
-                border-bottom: 2px solid rgba(255, 255, 255, 0.1);
-            }}
-            
-            .user-profile {{
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                position: relative;
-            }}
-            
-            .user-avatar {{
-                width: 50px;
-                height: 50px;
-                background: rgba(255, 255, 255, 0.2);
-                border-radius: 50%;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                font-size: 1.5rem;
-                flex-shrink: 0;
-            }}
-            
-            .user-info {{
-                flex: 1;
-            }}
-            
-            .user-info h3 {{
-                margin: 0;
-                font-size: 1.3rem;
-                font-weight: 700;
-                line-height: 1.3;
-            }}
-            
-            .user-info p {{
-                margin: 2px 0;
-                font-size: 0.85rem;
-                opacity: 0.9;
-                line-height: 1.2;
-            }}
-            
-            .user-coins {{
-                color: #fbbf24;
-                font-weight: bold;
-                font-size: 0.9rem;
-            }}
-            
-            .close-menu-btn {{
-                position: absolute;
-                top: -10px;
-                right: -10px;
-                background: rgba(255, 255, 255, 0.2);
-                border: none;
-                width: 36px;
-                height: 36px;
-                border-radius: 50%;
-                color: white;
-                font-size: 1.2rem;
-                cursor: pointer;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                transition: all 0.3s ease;
-                flex-shrink: 0;
-            }}
-            
-            .close-menu-btn:hover {{
-                background: rgba(255, 255, 255, 0.3);
-                transform: rotate(90deg);
-            }}
-            
-            /* Sidebar Content */
-            .sidebar-content {{
-                flex: 1;
-                overflow-y: auto;
-                padding: 1.5rem 0;
-            }}
-            
-            .menu-section {{
-                padding: 0 1.5rem;
-                margin-bottom: 1.8rem;
-            }}
-            
-            .menu-section:last-child {{
-                margin-bottom: 0;
-            }}
-            
-            .menu-section h4 {{
-                color: #666;
-                font-size: 0.85rem;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-                margin-bottom: 1rem;
-                padding-bottom: 0.5rem;
-                border-bottom: 1px solid #eee;
-                font-weight: 600;
-            }}
-            
-            .menu-item {{
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                padding: 0.9rem 1rem;
-                text-decoration: none;
-                color: #333;
-                border-radius: 8px;
-                margin-bottom: 0.4rem;
-                transition: all 0.2s ease;
-                position: relative;
-            }}
-            
-            .menu-item:hover {{
-                background: #f3f4f6;
-                color: #2563eb;
-                transform: translateX(5px);
-            }}
-            
-            .menu-item i {{
-                width: 20px;
-                text-align: center;
-                font-size: 1.1rem;
-                color: #666;
-                flex-shrink: 0;
-            }}
-            
-            .menu-item:hover i {{
-                color: #2563eb;
-            }}
-            
-            .menu-item span {{
-                flex: 1;
-                font-size: 0.95rem;
-                font-weight: 500;
-            }}
-            
-            .menu-badge {{
-                margin-left: auto;
-                background: #f59e0b;
-                color: white;
-                padding: 3px 9px;
-                border-radius: 10px;
-                font-size: 0.75rem;
-                font-weight: 600;
-                white-space: nowrap;
-            }}
-            
-            /* Sidebar Footer */
-            .sidebar-footer {{
-                padding: 1.2rem 1.5rem;
-                background: #f9fafb;
-                border-top: 1px solid #e5e7eb;
-                text-align: center;
-                flex-shrink: 0;
-            }}
-            
-            .sidebar-footer p {{
-                margin: 0.3rem 0;
-                font-size: 0.85rem;
-                color: #666;
-                line-height: 1.3;
-            }}
-            
-            /* Scrollbar Styling */
-            .sidebar-content::-webkit-scrollbar {{
-                width: 4px;
-            }}
-            
-            .sidebar-content::-webkit-scrollbar-track {{
-                background: #f1f1f1;
-            }}
-            
-            .sidebar-content::-webkit-scrollbar-thumb {{
-                background: #c1c1c1;
-                border-radius: 2px;
-            }}
-            
-            .sidebar-content::-webkit-scrollbar-thumb:hover {{
-                background: #a1a1a1;
-            }}
-            
-            /* Responsive */
-            @media (max-width: 768px) {{
-                .sidebar-menu {{
-                    width: 280px;
-                    left: -280px;
-                }}
-                
-                .menu-section {{
-                    padding: 0 1rem;
-                }}
-                
-                .menu-item {{
-                    padding: 0.8rem;
-                }}
-            }}
-            
-            @media (max-width: 480px) {{
-                .sidebar-menu {{
-                    width: 100%;
-                    left: -100%;
-                }}
-            }}
-        </style>
-        '''
-    
-    def generate_registration_page(self, coins, study_hours, study_minutes):
-        """Generate enhanced registration page with server-side coin tracking"""
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Study Challenge - Bimalism</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap">
-    
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-            font-family: 'Poppins', sans-serif;
-        }}
-        
-        body {{
-            background: #f9fafb;
-            color: #1f2937;
-            min-height: 100vh;
-        }}
-        
-        .app-container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            min-height: 100vh;
-            box-shadow: 0 0 30px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .app-header {{
-            background: linear-gradient(135deg, #2563eb, #4f46e5);
-            color: white;
-            padding: 1.2rem 1.5rem;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .back-button {{
-            background: rgba(255, 255, 255, 0.15);
-            border: none;
-            width: 44px;
-            height: 44px;
-            border-radius: 12px;
-            color: white;
-            font-size: 1.2rem;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.3s ease;
-            text-decoration: none;
-        }}
-        
-        .back-button:hover {{
-            background: rgba(255, 255, 255, 0.25);
-            transform: translateX(-3px);
-        }}
-        
-        .app-title {{
-            font-size: 1.5rem;
-            font-weight: 700;
-        }}
-        
-        .page-content {{
-            padding: 2rem 1.5rem;
-        }}
-        
-        /* Coin Dashboard */
-        .coin-dashboard {{
-            background: linear-gradient(135deg, #fbbf24, #f59e0b);
-            color: white;
-            border-radius: 20px;
-            padding: 2rem;
-            margin-bottom: 2rem;
-            box-shadow: 0 10px 20px rgba(245, 158, 11, 0.3);
-        }}
-        
-        .coin-stats {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 1.5rem;
-        }}
-        
-        .coin-info h3 {{
-            font-size: 1.2rem;
-            margin-bottom: 0.5rem;
-            opacity: 0.9;
-        }}
-        
-        .coin-value {{
-            font-size: 3rem;
-            font-weight: 700;
-            line-height: 1;
-        }}
-        
-        .coin-icon {{
-            font-size: 4rem;
-            opacity: 0.8;
-        }}
-        
-        .coin-progress {{
-            margin-top: 1.5rem;
-        }}
-        
-        .progress-label {{
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 0.5rem;
-            font-size: 0.9rem;
-            opacity: 0.9;
-        }}
-        
-        .progress-bar {{
-            height: 10px;
-            background: rgba(255, 255, 255, 0.2);
-            border-radius: 5px;
-            overflow: hidden;
-        }}
-        
-        .progress-fill {{
-            height: 100%;
-            background: white;
-            width: {(coins/30)*100}%;
-            border-radius: 5px;
-            transition: width 0.5s ease;
-        }}
-        
-        /* Timer Section */
-        .timer-section {{
-            background: linear-gradient(135deg, #1e40af, #1e3a8a);
-            color: white;
-            padding: 2rem;
-            border-radius: 20px;
-            margin-bottom: 2rem;
-            text-align: center;
-        }}
-        
-        .timer-display {{
-            font-size: 3.5rem;
-            font-family: monospace;
-            margin: 1rem 0;
-            font-weight: bold;
-            letter-spacing: 3px;
-        }}
-        
-        .timer-controls {{
-            display: flex;
-            gap: 1rem;
-            justify-content: center;
-            margin-top: 1.5rem;
-        }}
-        
-        .timer-btn {{
-            padding: 0.8rem 1.5rem;
-            border: none;
-            border-radius: 50px;
-            font-weight: 600;
-            font-size: 1rem;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            transition: all 0.3s;
-        }}
-        
-        .btn-start {{
-            background: #10b981;
-            color: white;
-        }}
-        
-        .btn-pause {{
-            background: #f59e0b;
-            color: white;
-        }}
-        
-        .btn-reset {{
-            background: #ef4444;
-            color: white;
-        }}
-        
-        .timer-btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.2);
-        }}
-        
-        .study-stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1rem;
-            margin-top: 2rem;
-        }}
-        
-        .stat-card {{
-            background: white;
-            padding: 1.5rem;
-            border-radius: 15px;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .stat-value {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #2563eb;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .stat-label {{
-            color: #6b7280;
-            font-size: 0.9rem;
-        }}
-        
-        /* Server Status */
-        .server-status {{
-            background: #f3f4f6;
-            padding: 1rem;
-            border-radius: 10px;
-            margin-top: 2rem;
-            text-align: center;
-            font-size: 0.9rem;
-            color: #4b5563;
-        }}
-        
-        .status-connected {{
-            color: #10b981;
-            font-weight: 600;
-        }}
-    </style>
-</head>
-<body>
-    <div class="app-container">
-        <header class="app-header">
-            <a href="/" class="back-button">
-                <i class="fas fa-arrow-left"></i>
-            </a>
-            <div class="app-title">Study Challenge</div>
-        </header>
-        
-        <main class="page-content">
-            <!-- Coin Dashboard -->
-            <div class="coin-dashboard">
-                <div class="coin-stats">
-                    <div class="coin-info">
-                        <h3>Study Challenge Progress</h3>
-                        <div class="coin-value" id="coinValue">{coins}</div>
-                        <p>Coins Earned • {study_hours}h {study_minutes}m studied</p>
-                    </div>
-                    <div class="coin-icon">
-                        <i class="fas fa-coins"></i>
-                    </div>
-                </div>
-                
-                <div class="coin-progress">
-                    <div class="progress-label">
-                        <span>Progress to Goal</span>
-                        <span id="progressLabel">{coins}/30 Coins</span>
-                    </div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="progressFill"></div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Timer Section -->
-            <div class="timer-section">
-                <h2><i class="fas fa-stopwatch"></i> Study Timer</h2>
-                <p>Track your study time and earn coins automatically</p>
-                
-                <div class="timer-display" id="timerDisplay">00:00:00</div>
-                
-                <div class="timer-controls">
-                    <button class="timer-btn btn-start" id="startTimer">
-                        <i class="fas fa-play"></i> Start
-                    </button>
-                    <button class="timer-btn btn-pause" id="pauseTimer">
-                        <i class="fas fa-pause"></i> Pause
-                    </button>
-                    <button class="timer-btn btn-reset" id="resetTimer">
-                        <i class="fas fa-redo"></i> Reset
-                    </button>
-                </div>
-            </div>
-            
-            <!-- Study Stats -->
-            <div class="study-stats">
-                <div class="stat-card">
-                    <div class="stat-value" id="totalTime">0h 0m</div>
-                    <div class="stat-label">Total Study Time</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-value" id="coinsEarned">{coins}</div>
-                    <div class="stat-label">Coins Earned</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-value" id="coinsNeeded">{30 - coins}</div>
-                    <div class="stat-label">Coins Needed</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-value" id="progressPercent">{((coins/30)*100):.1f}%</div>
-                    <div class="stat-label">Progress</div>
-                </div>
-            </div>
-            
-            <!-- Server Status -->
-            <div class="server-status">
-                <i class="fas fa-server"></i> 
-                <span class="status-connected">Connected to Server</span> • 
-                Coins and study time are being saved on the server
-            </div>
-            
-            <!-- Info Section -->
-            <div style="background: #f0f9ff; padding: 1.5rem; border-radius: 15px; margin-top: 2rem;">
-                <h3 style="color: #0369a1; margin-bottom: 1rem;">
-                    <i class="fas fa-info-circle"></i> How it Works
-                </h3>
-                <ul style="color: #4b5563; padding-left: 1.5rem;">
-                    <li style="margin-bottom: 0.5rem;">Start the timer when you begin studying</li>
-                    <li style="margin-bottom: 0.5rem;">Every 2 hours of study = 1 coin</li>
-                    <li style="margin-bottom: 0.5rem;">Reach 30 coins to get a special gift</li>
-                    <li>Your progress is saved on the server automatically</li>
-                </ul>
-            </div>
-        </main>
-    </div>
-    
-    <script>
-        // Timer variables
-        let timerInterval;
-        let studySeconds = 0;
-        let isTimerRunning = false;
-        let totalStudySeconds = {study_hours * 3600 + study_minutes * 60};
-        
-        // Update timer display
-        function updateTimerDisplay() {{
-            const hours = Math.floor(studySeconds / 3600);
-            const minutes = Math.floor((studySeconds % 3600) / 60);
-            const seconds = studySeconds % 60;
-            
-            document.getElementById('timerDisplay').textContent = 
-                `${{hours.toString().padStart(2, '0')}}:${{minutes.toString().padStart(2, '0')}}:${{seconds.toString().padStart(2, '0')}}`;
-        }}
-        
-        // Update total time display
-        function updateTotalTimeDisplay() {{
-            const totalHours = Math.floor(totalStudySeconds / 3600);
-            const totalMinutes = Math.floor((totalStudySeconds % 3600) / 60);
-            document.getElementById('totalTime').textContent = `${{totalHours}}h ${{totalMinutes}}m`;
-        }}
-        
-        // Start timer
-        function startTimer() {{
-            if (!isTimerRunning) {{
-                isTimerRunning = true;
-                timerInterval = setInterval(() => {{
-                    studySeconds++;
-                    updateTimerDisplay();
-                    
-                    // Save to server every 60 seconds
-                    if (studySeconds % 60 === 0) {{
-                        saveStudyTime();
-                    }}
-                }}, 1000);
-            }}
-        }}
-        
-        // Pause timer
-        function pauseTimer() {{
-            if (isTimerRunning) {{
-                isTimerRunning = false;
-                clearInterval(timerInterval);
-                saveStudyTime();
-            }}
-        }}
-        
-        // Reset timer
-        function resetTimer() {{
-            pauseTimer();
-            studySeconds = 0;
-            updateTimerDisplay();
-            saveStudyTime();
-        }}
-        
-        // Save study time to server
-        function saveStudyTime() {{
-            fetch('/api/update_coins', {{
-                method: 'POST',
-                headers: {{
-                    'Content-Type': 'application/json',
-                }},
-                body: JSON.stringify({{
-                    action: 'update_timer',
-                    study_seconds: studySeconds
-                }})
-            }})
-            .then(response => response.json())
-            .then(data => {{
-                if (data.success) {{
-                    // Update display with server data
-                    updateCoinDisplay(data.coins, data.study_time);
-                    studySeconds = 0; // Reset local timer after saving
-                    updateTimerDisplay();
-                }}
-            }})
-            .catch(error => console.error('Error saving study time:', error));
-        }}
-        
-        // Update coin display
-        function updateCoinDisplay(coins, studyTime) {{
-            totalStudySeconds = studyTime;
-            const hours = Math.floor(studyTime / 3600);
-            const minutes = Math.floor((studyTime % 3600) / 60);
-            
-            // Update all displays
-            document.getElementById('coinValue').textContent = coins;
-            document.getElementById('coinsEarned').textContent = coins;
-            document.getElementById('coinsNeeded').textContent = 30 - coins;
-            document.getElementById('progressLabel').textContent = coins + '/30 Coins';
-            document.getElementById('progressPercent').textContent = ((coins/30)*100).toFixed(1) + '%';
-            
-            // Update progress bar
-            const progress = (coins / 30) * 100;
-            document.getElementById('progressFill').style.width = progress + '%';
-            
-            // Update total time
-            updateTotalTimeDisplay();
-            
-            // Check if reached goal
-            if (coins >= 30) {{
-                showCongratulations();
-            }}
-        }}
-        
-        // Load data from server
-        function loadServerData() {{
-            fetch('/api/get_coins')
-                .then(response => response.json())
-                .then(data => {{
-                    updateCoinDisplay(data.coins, data.study_time);
-                }})
-                .catch(error => console.error('Error loading data:', error));
-        }}
-        
-        // Show congratulations message
-        function showCongratulations() {{
-            const congratMsg = document.createElement('div');
-            congratMsg.style.cssText = `
-                position: fixed;
-                top: 50%;
-                left: 50%;
-                transform: translate(-50%, -50%);
-                background: linear-gradient(135deg, #10b981, #059669);
-                color: white;
-                padding: 2rem;
-                border-radius: 20px;
-                box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-                z-index: 10000;
-                text-align: center;
-                animation: fadeIn 0.5s ease;
-            `;
-            congratMsg.innerHTML = `
-                <div style="font-size: 3rem; margin-bottom: 1rem;">🎉</div>
-                <h2 style="font-size: 1.8rem; margin-bottom: 0.5rem;">CONGRATULATIONS!</h2>
-                <p style="margin-bottom: 1.5rem;">You've reached 30 coins! 🎁</p>
-                <button onclick="this.parentElement.remove()" style="padding: 0.8rem 1.5rem; background: white; color: #10b981; border: none; border-radius: 25px; font-weight: bold; cursor: pointer;">
-                    Continue Studying
-                </button>
-            `;
-            document.body.appendChild(congratMsg);
-        }}
-        
-        // Event listeners
-        document.getElementById('startTimer').addEventListener('click', startTimer);
-        document.getElementById('pauseTimer').addEventListener('click', pauseTimer);
-        document.getElementById('resetTimer').addEventListener('click', resetTimer);
-        
-        // Initial setup
-        updateTimerDisplay();
-        updateTotalTimeDisplay();
-        loadServerData();
-        
-        // Auto-save on page unload
-        window.addEventListener('beforeunload', function() {{
-            if (studySeconds > 0) {{
-                saveStudyTime();
-            }}
-        }});
-        
-        // Load data every 30 seconds
-        setInterval(loadServerData, 30000);
-    </script>
-</body>
-</html>'''
-    
-    def wrap_in_app_layout(self, content, title):
-        """Wrap content in app layout"""
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Bimalism</title>
-    
-    <!-- Font Awesome -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    
-    <!-- Google Fonts -->
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Poppins', sans-serif;
-            background: #f9fafb;
-            color: #1f2937;
-            min-height: 100vh;
-        }}
-        
-        .app-container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            min-height: 100vh;
-            box-shadow: 0 0 30px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .app-header {{
-            background: linear-gradient(135deg, #2563eb, #4f46e5);
-            color: white;
-            padding: 1.2rem 1.5rem;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .back-button {{
-            background: rgba(255, 255, 255, 0.15);
-            border: none;
-            width: 44px;
-            height: 44px;
-            border-radius: 12px;
-            color: white;
-            font-size: 1.2rem;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.3s ease;
-            text-decoration: none;
-        }}
-        
-        .back-button:hover {{
-            background: rgba(255, 255, 255, 0.25);
-            transform: translateX(-3px);
-        }}
-        
-        .app-title {{
-            font-size: 1.5rem;
-            font-weight: 700;
-        }}
-        
-        .module-content {{
-            padding: 2rem 1.5rem;
-        }}
-    </style>
-</head>
-<body>
-    <div class="app-container">
-        <header class="app-header">
-            <a href="/" class="back-button">
-                <i class="fas fa-arrow-left"></i>
-            </a>
-            <div class="app-title">{title}</div>
-        </header>
-        
-        <main class="module-content">
-            {content}
-        </main>
-    </div>
-    
-    <script>
-        console.log('📚 {title} Page Loaded');
-    </script>
-</body>
-</html>'''
-
-def start_server():
-    """Start the Bimalism server"""
-    print("=" * 70)
-    print("🚀 BIMALISM SERVER WITH CLEAN HAMBURGER MENU")
-    print("=" * 70)
-    print("✨ FEATURES:")
-    print("   • Clean header with only logo")
-    print("   • Hamburger menu in top-right corner")
-    print("   • Sidebar with ONLY requested items")
-    print("   • Server-side coin tracking")
-    print("")
-    print("📱 MENU INCLUDES ONLY:")
-    print("   • Home")
-    print("   • Bio Data")
-    print("   • Features")
-    print("   • NEET")
-    print("   • JEE")
-    print("   • Results")
-    print("   • Testimonials")
-    print("   • Game")
-    print("   • Study Challenge (with coins)")
-    print("   • Study Resources")
-    print("   • Calculator")
-    print("   • Settings")
-    print("   • Download App")
-    print("")
-    print("💰 COIN TRACKING:")
-    print("   • Study timer saves to server")
-    print("   • 2 hours = 1 coin (auto-calculated)")
-    print("   • Data stored in: bimalism_data.json")
-    print("")
-    print(f"🌐 Access at: http://localhost:{PORT}")
-    print("=" * 70)
-    
-    # Create data file if not exists
-    if not os.path.exists(DATA_FILE):
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump({
-                'coins': 0,
-                'study_time': 0,
-                'last_updated': datetime.now().isoformat()
-            }, f, indent=2)
-        print(f"📁 Created data file: {DATA_FILE}")
-    
-    # Create missing HTML files
-    required_files = [
-        'neet.html', 'jee.html', 'g.html', 'settings.html', 
-        'tips.html', 'table.html', 'calculator.html', 'bio-data-pop-up.html',
-        'h.html', 't.html'
-    ]
-    
-    for filename in required_files:
-        if not os.path.exists(filename):
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>{filename.replace('.html', '').upper()} - Bimalism</title>
-</head>
-<body style="padding: 2rem; text-align: center;">
-    <h1>{filename.replace('.html', '').replace('-', ' ').title()}</h1>
-    <p>This page is under construction.</p>
-    <a href="/" style="display: inline-block; margin-top: 1rem; padding: 0.8rem 1.5rem; background: #2563eb; color: white; border-radius: 25px; text-decoration: none;">
-        ← Back to Home
-    </a>
-</body>
-</html>''')
-            print(f"📄 Created placeholder: {filename}")
-    
-    try:
-        webbrowser.open(f"http://localhost:{PORT}")
-    except:
-        pass
-    
-    with socketserver.TCPServer(("", PORT), BimalismServer) as httpd:
-        try:
-            print(f"✅ Server started on port {PORT}")
-            print("🍔 Click the hamburger menu (top-right) for navigation")
-            print("📱 Menu shows ONLY the requested items")
-            print("⏰ Go to /registration to start the study timer")
-            print("🔄 Press Ctrl+C to stop server")
-            print("=" * 70)
-            httpd.serve_forever()
-        except KeyboardInterrupt:
-            print("\n👋 Server stopped")
-            print("✨ Thank you for using Bimalism!")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+BIMALISM SERVER with Simplified Hamburger Menu
+Features:
+1. Hamburger menu in top-right corner
+2. Opens sidebar with ONLY requested items
+3. Tracks coins and study time on server
+4. Clean header without original navigation
+"""
+
+import atexit
+import email.utils
+import functools
+import gzip
+import http.server
+import webbrowser
+import os
+import json
+import re
+import shutil
+import signal
+import sqlite3
+import sys
+import threading
+import time
+from urllib.parse import urlparse, parse_qs
+import mimetypes
+from datetime import datetime
+
+try:
+    import orjson  # optional: much faster JSON, emits bytes directly
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_loads(data):
+    """Parse JSON from bytes or str (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+PORT = 8080
+DATA_FILE = 'bimalism_data.json'  # legacy JSON state, imported into the DB once
+DB_FILE = 'bimalism.db'
+
+_DB = None
+
+def _get_db():
+    """Open (and initialize) the state database on first use"""
+    global _DB
+    if _DB is None:
+        db = sqlite3.connect(DB_FILE, isolation_level=None, check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute('CREATE TABLE IF NOT EXISTS state(k TEXT PRIMARY KEY, v)')
+        if db.execute('SELECT COUNT(*) FROM state').fetchone()[0] == 0:
+            # First run: carry over any state from the old JSON data file
+            legacy = {}
+            if os.path.exists(DATA_FILE):
+                try:
+                    with open(DATA_FILE, 'r', encoding='utf-8') as f:
+                        legacy = json.load(f)
+                except (OSError, ValueError):
+                    pass
+            db.executemany('INSERT INTO state(k, v) VALUES (?, ?)', [
+                ('coins', legacy.get('coins', 0)),
+                ('study_time', legacy.get('study_time', 0)),
+                ('last_updated', legacy.get('last_updated', datetime.now().isoformat())),
+            ])
+        _DB = db
+    return _DB
+
+# Coins and study time are monotonic counters owned by this process, so
+# they live in memory and are flushed to the database in the background
+# instead of hitting disk on every POST
+_FLUSH_INTERVAL = 5  # seconds
+_STATE = None
+_STATE_LOCK = threading.Lock()
+_STATE_DIRTY = threading.Event()  # set on mutation; wakes the flusher thread
+_STATE_VERSION = 0  # bumped on every mutation; versions pre-built responses
+_CACHED_COINS_RESPONSE = None  # (version, etag, body) for /api/get_coins
+_CACHED_TIMER_RESPONSE = None  # same, for /api/get_timer
+# Wakes /api/events streams when the state version moves
+_SSE_CONDITION = threading.Condition()
+
+def _flush_state() -> None:
+    """Write the in-memory state back to the database if it changed"""
+    with _STATE_LOCK:
+        if not _STATE_DIRTY.is_set() or _STATE is None:
+            return
+        snapshot = list(_STATE.items())
+        _STATE_DIRTY.clear()
+    _get_db().executemany(
+        'INSERT INTO state(k, v) VALUES (?, ?) '
+        'ON CONFLICT(k) DO UPDATE SET v=excluded.v',
+        snapshot)
+
+def _state_flusher() -> None:
+    """Background thread: sleep until state changes, then batch-flush"""
+    while True:
+        # Block until something is dirty, then wait out the interval so a
+        # burst of updates coalesces into one write
+        _STATE_DIRTY.wait()
+        time.sleep(_FLUSH_INTERVAL)
+        _flush_state()
+
+# In-memory caches so we don't re-read and re-assemble the same pages
+# on every request:
+#   _PAGE_CACHE: fully assembled, UTF-8 encoded pages keyed by (filename, variant)
+#   _GZIP_CACHE: gzip-compressed twins of _PAGE_CACHE entries, same keys
+#   _FILE_CACHE: raw file text keyed by filename, stored with its mtime
+_PAGE_CACHE = {}
+_GZIP_CACHE = {}
+_FILE_CACHE = {}
+
+# Assembled under-construction pages for menu routes whose HTML file
+# doesn't exist on disk, keyed by title; built lazily on first request
+_PLACEHOLDER_CACHE = {}
+
+# Precompiled patterns for the homepage header swap and JS injection,
+# so each runs as one C-level pass instead of repeated str scans
+_HEADER_RE = re.compile(rb'<header>.*?</header>', re.DOTALL)
+_BODY_CLOSE_RE = re.compile(rb'</body>')
+
+# Static files up to this size are kept in the in-memory file cache;
+# anything bigger is streamed from disk instead of slurped into memory
+_SMALL_FILE_LIMIT = 64 * 1024
+
+# Far-future Expires for /static/ assets, formatted once at import so it
+# isn't re-rendered per response (10 years out, RFC 1123)
+_STATIC_EXPIRES = email.utils.formatdate(time.time() + 10 * 365 * 24 * 3600, usegmt=True)
+
+# Conservative CSS minification, applied once per file version as the
+# file enters the cache: comments out, whitespace runs collapsed,
+# spaces around punctuation dropped. Stacks with gzip, since shorter
+# repetitive text also compresses better.
+_CSS_COMMENT_RE = re.compile(rb'/\*.*?\*/', re.DOTALL)
+_CSS_WS_RE = re.compile(rb'\s+')
+_CSS_PUNCT_RE = re.compile(rb'\s*([{};:,>])\s*')
+
+def _minify_css(raw: bytes) -> bytes:
+    """Strip comments and collapse whitespace in a CSS byte string"""
+    out = _CSS_COMMENT_RE.sub(b'', raw)
+    out = _CSS_WS_RE.sub(b' ', out)
+    out = _CSS_PUNCT_RE.sub(rb'\1', out)
+    return out.strip()
+
+def _read_cached_file(filename: str) -> bytes:
+    """Read a file (as bytes) through the in-memory cache, re-reading only when its mtime changes"""
+    mtime = os.stat(filename).st_mtime
+    cached = _FILE_CACHE.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(filename, 'rb') as f:
+        raw = f.read()
+    if filename.endswith('.css'):
+        # The formatted source stays on disk; the wire only ever sees
+        # the minified bytes
+        raw = _minify_css(raw)
+    _FILE_CACHE[filename] = (mtime, raw)
+    # Pages assembled from the old file contents are stale now. pop()
+    # rather than del: a concurrent update can clear the whole cache
+    # between taking this key snapshot and removing an entry.
+    for key in [k for k in _PAGE_CACHE if k[0] == filename]:
+        _PAGE_CACHE.pop(key, None)
+        _GZIP_CACHE.pop(key, None)
+    return raw
+
+# Initialize MIME types
+mimetypes.init()
+mimetypes.add_type('application/javascript', '.js')
+mimetypes.add_type('text/css', '.css')
+
+# Extension -> MIME type for the static file handler: one dict lookup
+# on the extension instead of a chain of endswith checks
+_MIME_TYPES = {
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.html': 'text/html',
+}
+
+# Text types worth gzip-compressing when the client allows it
+_COMPRESSIBLE_TYPES = frozenset({'text/css', 'application/javascript',
+                                 'text/html', 'text/plain'})
+
+# Static page fragments, rendered once at import time and pre-encoded to
+# UTF-8 so the per-request cost is a few bytes concatenations. Only the
+# coin count varies, so the sidebar template is split into constant
+# chunks around its two coin slots.
+_CLEAN_HEADER_BYTES = '''<header>
+    <div class="container">
+        <nav>
+            <div class="logo">
+                <span>Bimalism</span>
+            </div>
+            
+            <!-- Hamburger Menu Button (Top-Right) -->
+            <div class="hamburger-menu-container">
+                <button class="hamburger-btn" id="hamburgerBtn">
+                    <span></span>
+                    <span></span>
+                    <span></span>
+                </button>
+            </div>
+        </nav>
+    </div>
+    
+    <link rel="stylesheet" href="/static/app.css">
+</header>'''.encode('utf-8')
+
+_SIDEBAR_PREFIX_BYTES = '''
+        <!-- Sidebar Menu (Left Side) -->
+        <div class="sidebar-menu" id="sidebarMenu">
+            <div class="sidebar-header">
+                <div class="user-profile">
+                    <div class="user-avatar">
+                        <i class="fas fa-user-graduate"></i>
+                    </div>
+                    <div class="user-info">
+                        <h3>Bimalism</h3>
+                        <p class="user-coins">'''.encode('utf-8')
+
+_SIDEBAR_MID_BYTES = ''' Coins</p>
+                        <p>Education Portal</p>
+                    </div>
+                    <button class="close-menu-btn" id="closeMenuBtn">
+                        <i class="fas fa-times"></i>
+                    </button>
+                </div>
+            </div>
+            
+            <div class="sidebar-content">
+                <!-- ONLY REQUESTED ITEMS -->
+                <div class="menu-section">
+                    <h4>Navigation</h4>
+                    
+                    <a href="/" class="menu-item">
+                        <i class="fas fa-home"></i>
+                        <span>Home</span>
+                    </a>
+                    
+                    <a href="/bio-data-pop-up" class="menu-item">
+                        <i class="fas fa-user-circle"></i>
+                        <span>Bio Data</span>
+                    </a>
+                    
+                    <a href="#features" class="menu-item">
+                        <i class="fas fa-star"></i>
+                        <span>Features</span>
+                    </a>
+                    
+                    <a href="/neet" class="menu-item">
+                        <i class="fas fa-stethoscope"></i>
+                        <span>NEET</span>
+                    </a>
+                    
+                    <a href="/jee" class="menu-item">
+                        <i class="fas fa-calculator"></i>
+                        <span>JEE</span>
+                    </a>
+                    
+                    <a href="#results" class="menu-item">
+                        <i class="fas fa-chart-line"></i>
+                        <span>Results</span>
+                    </a>
+                    
+                    <a href="#testimonials" class="menu-item">
+                        <i class="fas fa-comments"></i>
+                        <span>Testimonials</span>
+                    </a>
+                    
+                    <a href="/game" class="menu-item">
+                        <i class="fas fa-gamepad"></i>
+                        <span>Game</span>
+                    </a>
+                </div>
+                
+                <!-- Additional Useful Pages -->
+                <div class="menu-section">
+                    <h4>Study Tools</h4>
+                    
+                    <a href="/registration" class="menu-item">
+                        <i class="fas fa-trophy"></i>
+                        <span>Study Challenge</span>
+                        <span class="menu-badge">'''.encode('utf-8')
+
+_SIDEBAR_SUFFIX_BYTES = ''' coins</span>
+                    </a>
+                    
+                    <a href="/table" class="menu-item">
+                        <i class="fas fa-book"></i>
+                        <span>Study Resources</span>
+                    </a>
+                    
+                    <a href="/calculator" class="menu-item">
+                        <i class="fas fa-calculator"></i>
+                        <span>Calculator</span>
+                    </a>
+                </div>
+                
+                <!-- App Settings -->
+                <div class="menu-section">
+                    <h4>Settings</h4>
+                    
+                    <a href="/settings" class="menu-item">
+                        <i class="fas fa-cog"></i>
+                        <span>Settings</span>
+                    </a>
+                    
+                    <a href="#download-section" class="menu-item">
+                        <i class="fas fa-download"></i>
+                        <span>Download App</span>
+                    </a>
+                </div>
+            </div>
+            
+            <div class="sidebar-footer">
+                <p>Bimalism Education Platform</p>
+                <p>© 2024 All rights reserved</p>
+            </div>
+        </div>
+        
+        <!-- Overlay -->
+        <div class="overlay" id="overlay"></div>
+        
+        '''.encode('utf-8')
+
+_MENU_JS_BYTES = '''
+            <script>
+            // Flat low-fi styles on devices with little memory or few cores
+            if ((navigator.deviceMemory || 8) < 4 || (navigator.hardwareConcurrency || 8) <= 2) {
+                document.body.classList.add('low-fi');
+            }
+
+            // Hamburger Menu Toggle
+            const hamburgerBtn = document.getElementById('hamburgerBtn');
+            const sidebarMenu = document.getElementById('sidebarMenu');
+            const overlay = document.getElementById('overlay');
+            const closeMenuBtn = document.getElementById('closeMenuBtn');
+            
+            function openMenu() {
+                sidebarMenu.classList.add('active');
+                overlay.classList.add('active');
+                document.body.style.overflow = 'hidden';
+            }
+            
+            function closeMenu() {
+                sidebarMenu.classList.remove('active');
+                overlay.classList.remove('active');
+                document.body.style.overflow = 'auto';
+            }
+            
+            if (hamburgerBtn) {
+                hamburgerBtn.addEventListener('click', openMenu);
+            }
+            
+            if (closeMenuBtn) {
+                closeMenuBtn.addEventListener('click', closeMenu);
+            }
+            
+            if (overlay) {
+                overlay.addEventListener('click', closeMenu);
+            }
+            
+            // Close menu when clicking on menu items
+            const menuItems = document.querySelectorAll('.menu-item');
+            menuItems.forEach(item => {
+                item.addEventListener('click', function(e) {
+                    // Only close for internal links
+                    if (this.getAttribute('href') && !this.getAttribute('href').startsWith('#')) {
+                        closeMenu();
+                    }
+                });
+            });
+            
+            // Close menu with Escape key
+            document.addEventListener('keydown', function(e) {
+                if (e.key === 'Escape') closeMenu();
+            });
+            
+            // Load coin data from server
+            function showCoins(coins) {
+                // Update coin counter in menu
+                const coinBadge = document.querySelector('.menu-badge');
+                if (coinBadge) {
+                    coinBadge.textContent = coins + ' coins';
+                }
+                
+                // Update coin display in menu header
+                const coinDisplay = document.querySelector('.user-coins');
+                if (coinDisplay) {
+                    coinDisplay.textContent = coins + ' Coins';
+                }
+            }
+            
+            // Server pushes coin changes over one long-lived stream;
+            // the first event carries current state, so the badge needs
+            // no initial fetch and no polling
+            const coinEvents = new EventSource('/api/events');
+            coinEvents.onmessage = e => showCoins(JSON.parse(e.data).coins);
+            </script>
+            '''.encode('utf-8')
+
+def _sidebar_menu_bytes(user_coins: int) -> bytes:
+    """Assemble the sidebar menu for a coin count from pre-encoded fragments"""
+    coins = str(user_coins).encode('utf-8')
+    return b''.join([_SIDEBAR_PREFIX_BYTES, coins, _SIDEBAR_MID_BYTES,
+                     coins, _SIDEBAR_SUFFIX_BYTES])
+
+@functools.lru_cache(maxsize=64)
+def _menu_injection_bytes(user_coins: int) -> bytes:
+    """Sidebar plus menu script for a coin count, memoized per count"""
+    return _sidebar_menu_bytes(user_coins) + _MENU_JS_BYTES
+
+
+# App layout template for menu pages, split at import around its three
+# title slots and single content slot and pre-encoded to UTF-8
+_LAYOUT_PARTS = (
+    '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>'''.encode('utf-8'),
+    ''' - Bimalism</title>
+    
+    <!-- Font Awesome -->
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    
+    <!-- Google Fonts -->
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+    
+    <link rel="stylesheet" href="/static/common.css">
+    <style>
+        .module-content {
+            padding: 2rem 1.5rem;
+        }
+    </style>
+</head>
+<body>
+    <div class="app-container">
+        <header class="app-header">
+            <a href="/" class="back-button">
+                <i class="fas fa-arrow-left"></i>
+            </a>
+            <div class="app-title">'''.encode('utf-8'),
+    '''</div>
+        </header>
+        
+        <main class="module-content">
+            '''.encode('utf-8'),
+    '''
+        </main>
+    </div>
+    
+    <script>
+        console.log('📚 '''.encode('utf-8'),
+    ''' Page Loaded');
+    </script>
+</body>
+</html>'''.encode('utf-8'),
+)
+
+
+class BimalismServer(http.server.SimpleHTTPRequestHandler):
+    """Server handler with simplified hamburger menu"""
+
+    # HTTP/1.1 keeps connections alive, so a page and its asset burst
+    # share one TCP connection (every response carries Content-Length)
+    protocol_version = 'HTTP/1.1'
+
+    # Buffer outgoing writes in 64 KiB blocks (instead of unbuffered
+    # per-write syscalls) to match typical TCP send windows
+    wbufsize = 64 * 1024
+
+    # Small JSON responses on kept-alive connections shouldn't wait on
+    # Nagle's algorithm coalescing them with the next write
+    disable_nagle_algorithm = True
+
+    # Path -> handler method name for the JSON API
+    _API_ROUTES = {
+        '/api/get_coins': 'get_coins_data',
+        '/api/get_timer': 'get_timer_data',
+        '/api/events': 'stream_events',
+        '/api/update_coins': 'update_coins',
+    }
+
+    # Path (including aliases) -> (filename, title) for menu pages
+    _ROUTES = {
+        '/neet': ('neet.html', 'NEET Preparation'),
+        '/neet.html': ('neet.html', 'NEET Preparation'),
+        '/jee': ('jee.html', 'JEE Preparation'),
+        '/jee.html': ('jee.html', 'JEE Preparation'),
+        '/game': ('g.html', 'Educational Games'),
+        '/g.html': ('g.html', 'Educational Games'),
+        '/settings': ('settings.html', 'Settings'),
+        '/settings.html': ('settings.html', 'Settings'),
+        '/tips': ('tips.html', 'Study Tips'),
+        '/tips.html': ('tips.html', 'Study Tips'),
+        '/table': ('table.html', 'Study Resources'),
+        '/table.html': ('table.html', 'Study Resources'),
+        '/calculator': ('calculator.html', 'Calculator'),
+        '/calculator.html': ('calculator.html', 'Calculator'),
+        '/bio-data-pop-up': ('bio-data-pop-up.html', 'Student Profile'),
+        '/bio-data-pop-up.html': ('bio-data-pop-up.html', 'Student Profile'),
+        '/h.html': ('h.html', 'हिंदी'),
+        '/t.html': ('t.html', 'தமிழ்'),
+    }
+
+    def do_GET(self) -> None:
+        parsed_path = urlparse(self.path)
+        path = parsed_path.path
+
+        print(f"📱 Request: {path}")
+
+        # API endpoints (dict lookup instead of an if/elif chain)
+        api_handler = self._API_ROUTES.get(path)
+        if api_handler:
+            getattr(self, api_handler)()
+            return
+
+        # Serve HTML pages with menu
+        if path == '/' or path == '/index.html':
+            self.serve_homepage()
+        elif path == '/registration' or path == '/registration.html':
+            self.serve_registration_page()
+        else:
+            route = self._ROUTES.get(path)
+            if route:
+                self.serve_page_with_menu(*route)
+            else:
+                # Try to serve static files
+                self.serve_static_file(path)
+    
+    def send_html(self, page_bytes: bytes, cache_key=None) -> None:
+        """Send an HTML page, gzip-compressed when the client supports it"""
+        encoding = None
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = _GZIP_CACHE.get(cache_key) if cache_key else None
+            if body is None:
+                body = gzip.compress(page_bytes, compresslevel=6)
+                if cache_key is not None:
+                    _GZIP_CACHE[cache_key] = body
+            encoding = 'gzip'
+        else:
+            body = page_bytes
+
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        self.wfile.write(memoryview(body))
+
+    def serve_homepage(self) -> None:
+        """Serve homepage with clean header and hamburger menu"""
+        try:
+            # Load data
+            data = self.load_data()
+            user_coins = data.get('coins', 0)
+            study_time = data.get('study_time', 0)
+
+            # Re-read index.html if it changed on disk (one stat on a
+            # hit); this also pops page entries assembled from the old
+            # contents, so the cache check below can't serve stale bytes
+            html_content = _read_cached_file('index.html')
+
+            # Serve from cache if we already assembled this page for this coin count
+            cache_key = ('index.html', user_coins)
+            cached_page = _PAGE_CACHE.get(cache_key)
+            if cached_page is not None:
+                self.send_html(cached_page, cache_key)
+                return
+
+            # Swap the original header for the pre-encoded clean version
+            # in a single compiled-regex pass
+            html_content, replaced = _HEADER_RE.subn(
+                lambda m: _CLEAN_HEADER_BYTES, html_content, count=1)
+            if not replaced and b'<body>' in html_content:
+                # If no header found, add clean header at top
+                html_content = html_content.replace(b'<body>', b'<body>' + _CLEAN_HEADER_BYTES, 1)
+
+            # Sidebar menu + menu JavaScript, injected before the closing body tag
+            js_injection = _menu_injection_bytes(user_coins)
+            html_content, injected = _BODY_CLOSE_RE.subn(
+                lambda m: js_injection + b'\n</body>', html_content, count=1)
+            if not injected:
+                html_content += js_injection
+
+            # Cache the assembled page so the next hit is a dict lookup + write
+            page_bytes = html_content
+            _PAGE_CACHE[cache_key] = page_bytes
+
+            self.send_html(page_bytes, cache_key)
+
+        except Exception as e:
+            print(f"Error serving homepage: {e}")
+            self.send_error(500, f"Internal Server Error: {str(e)}")
+    
+    def serve_registration_page(self) -> None:
+        """Serve registration page with timer and coin tracking"""
+        try:
+            # Load data
+            data = self.load_data()
+            user_coins = data.get('coins', 0)
+            study_time = data.get('study_time', 0)
+            study_hours, remainder = divmod(study_time, 3600)
+            study_minutes = remainder // 60
+
+            # Memoized per (coins, hours, minutes), so timer-poll refreshes
+            # of an unchanged page cost a cache lookup
+            page_bytes = _registration_page_bytes(user_coins, study_hours, study_minutes)
+            self.send_html(page_bytes, ('registration', user_coins, study_hours, study_minutes))
+            
+        except Exception as e:
+            print(f"Error serving registration page: {e}")
+            self.send_error(500, f"Internal Server Error: {str(e)}")
+    
+    def serve_page_with_menu(self, filename: str, title: str) -> None:
+        """Serve any page with menu navigation"""
+        try:
+            if os.path.exists(filename):
+                # Re-read the file if it changed on disk; this pops page
+                # entries assembled from the old contents, so the cache
+                # check below can't serve stale bytes
+                html_source = _read_cached_file(filename)
+
+                # Serve the assembled page from cache when possible
+                cache_key = (filename, title)
+                page_bytes = _PAGE_CACHE.get(cache_key)
+                if page_bytes is None:
+                    # Wrap in app layout with menu
+                    page_bytes = self.wrap_in_app_layout(
+                        html_source.decode('utf-8'), title)
+                    _PAGE_CACHE[cache_key] = page_bytes
+
+                self.send_html(page_bytes, cache_key)
+            else:
+                # Serve an in-memory placeholder, built on first request;
+                # nothing is written to disk for pages nobody visits
+                page_bytes = _PLACEHOLDER_CACHE.get(title)
+                if page_bytes is None:
+                    default_content = f'''
+                <div style="padding: 2rem; text-align: center;">
+                    <h1 style="color: #2563eb;">{title}</h1>
+                    <p>This page is under construction.</p>
+                    <a href="/" style="display: inline-block; margin-top: 1rem; padding: 0.8rem 1.5rem; background: #2563eb; color: white; border-radius: 25px; text-decoration: none;">
+                        ← Back to Home
+                    </a>
+                </div>
+                '''
+                    page_bytes = self.wrap_in_app_layout(default_content, title)
+                    _PLACEHOLDER_CACHE[title] = page_bytes
+                self.send_html(page_bytes, ('placeholder', title))
+
+        except Exception as e:
+            print(f"Error serving {filename}: {e}")
+            self.send_error(404, f"Page not found: {filename}")
+    
+    def serve_static_file(self, path: str) -> None:
+        """Serve static files with conditional-request support"""
+        try:
+            filepath = '.' + path
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                self.send_error(404, "File not found")
+                return
+
+            # Determine MIME type
+            mimetype = _MIME_TYPES.get(os.path.splitext(path)[1].lower(), 'text/plain')
+
+            # Small text assets are worth compressing; the gzip twin is
+            # cached per (file, mtime) so compression happens once
+            compress = (stat.st_size <= _SMALL_FILE_LIMIT
+                        and mimetype in _COMPRESSIBLE_TYPES
+                        and 'gzip' in self.headers.get('Accept-Encoding', ''))
+
+            # Clients that already have this version get a bodyless 304
+            etag = f'"{int(stat.st_mtime):x}-{stat.st_size:x}{"-gz" if compress else ""}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            body = None
+            if compress:
+                gzip_key = (filepath, stat.st_mtime)
+                body = _GZIP_CACHE.get(gzip_key)
+                if body is None:
+                    body = _GZIP_CACHE[gzip_key] = gzip.compress(
+                        _read_cached_file(filepath), compresslevel=6)
+            elif stat.st_size <= _SMALL_FILE_LIMIT:
+                # Cached (and, for CSS, minified) bytes may be smaller
+                # than the file on disk, so size the response from them
+                body = _read_cached_file(filepath)
+
+            self.send_response(200)
+            self.send_header('Content-type', mimetype)
+            if compress:
+                self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Content-Length',
+                             str(len(body) if body is not None else stat.st_size))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', self.date_time_string(stat.st_mtime))
+            if path.startswith('/static/'):
+                # Extracted assets never change in place, so let browsers
+                # keep them for good
+                self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+                self.send_header('Expires', _STATIC_EXPIRES)
+            self.end_headers()
+
+            if body is not None:
+                # memoryview avoids copying the cached blob into the
+                # writer's buffer before it hits the socket
+                self.wfile.write(memoryview(body))
+            else:
+                # Large files go from the page cache straight to the
+                # socket: socket.sendfile uses sendfile(2) where the
+                # platform has it and degrades to a send loop otherwise.
+                # Headers are sitting in the buffered writer, so flush
+                # them before writing to the raw socket underneath it.
+                with open(filepath, 'rb') as f:
+                    self.wfile.flush()
+                    self.connection.sendfile(f)
+
+        except Exception as e:
+            self.send_error(404, f"File not found: {str(e)}")
+    
+    def do_POST(self) -> None:
+        """Handle POST requests for updating coins"""
+        if self.path.startswith('/api/update_coins'):
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            
+            try:
+                # Parse the data
+                data = _json_loads(post_data)
+
+                if data.get('action') == 'add_coin':
+                    # Add coin from study time
+                    study_seconds = data.get('study_seconds', 0)
+                    new_coins = study_seconds // 7200  # 2 hours = 7200 seconds = 1 coin
+
+                    def apply(state):
+                        state['coins'] = state.get('coins', 0) + new_coins
+                        state['study_time'] = state.get('study_time', 0) + study_seconds
+                        state['last_updated'] = datetime.now().isoformat()
+
+                    server_data = self.update_data(apply)
+
+                    response = {
+                        'success': True,
+                        'coins': server_data['coins'],
+                        'study_time': server_data['study_time'],
+                        'coins_added': new_coins
+                    }
+
+                elif data.get('action') == 'update_timer':
+                    # Update study time and recalculate coins from it.
+                    # Saves carry a monotonic seq tag; one already seen
+                    # (pause, hide and unload can race the same save)
+                    # must not count the seconds twice.
+                    study_seconds = data.get('study_seconds', 0)
+                    seq = data.get('seq')
+                    duplicate = []
+
+                    def apply(state):
+                        if seq is not None:
+                            # Only an exact replay of the last-applied
+                            # save is a duplicate; a lower seq is just a
+                            # slower tab or out-of-order delivery and its
+                            # seconds are distinct, so they must count
+                            if seq == state.get('last_seq_seen'):
+                                duplicate.append(True)
+                                return
+                            state['last_seq_seen'] = seq
+                        state['study_time'] = state.get('study_time', 0) + study_seconds
+                        state['coins'] = state['study_time'] // 7200
+                        state['last_updated'] = datetime.now().isoformat()
+
+                    server_data = self.update_data(apply)
+
+                    response = {
+                        'success': True,
+                        'coins': server_data.get('coins', 0),
+                        'study_time': server_data.get('study_time', 0),
+                        'duplicate': bool(duplicate)
+                    }
+
+                else:
+                    response = {'success': False, 'error': 'Unknown action'}
+                    
+            except Exception as e:
+                response = {'success': False, 'error': str(e)}
+            
+            self.send_json(response)
+        else:
+            self.send_error(404, "Not Found")
+    
+    def send_json(self, response: dict) -> None:
+        """Send a JSON response with preamble and body in a single write"""
+        self.send_json_bytes(_json_dumps(response))
+
+    def send_json_bytes(self, body: bytes, etag: str = '') -> None:
+        """Send pre-serialized JSON; with an ETag, clients may revalidate"""
+        cache_headers = f'ETag: {etag}\r\nCache-Control: no-cache\r\n' if etag else ''
+        head = (f'{self.protocol_version} 200 OK\r\n'
+                f'Server: {self.version_string()}\r\n'
+                f'Date: {self.date_time_string()}\r\n'
+                'Content-Type: application/json\r\n'
+                f'Content-Length: {len(body)}\r\n'
+                'Access-Control-Allow-Origin: *\r\n'
+                f'{cache_headers}'
+                '\r\n').encode('latin-1')
+        self.wfile.write(head + body)
+        self.log_request(200)
+
+    def get_coins_data(self) -> None:
+        """API: Get coins data"""
+        global _CACHED_COINS_RESPONSE
+        cached = _CACHED_COINS_RESPONSE
+        if cached is None or cached[0] != _STATE_VERSION:
+            data = self.load_data()
+            body = _json_dumps({
+                'coins': data.get('coins', 0),
+                'study_time': data.get('study_time', 0),
+                'last_updated': data.get('last_updated', '')
+            })
+            etag = f'"{_STATE_VERSION}-{data.get("coins", 0)}"'
+            cached = _CACHED_COINS_RESPONSE = (_STATE_VERSION, etag, body)
+
+        _, etag, body = cached
+        # Pollers that already have this state get a bodyless 304
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_json_bytes(body, etag)
+    
+    def get_timer_data(self) -> None:
+        """API: Get timer data"""
+        global _CACHED_TIMER_RESPONSE
+        cached = _CACHED_TIMER_RESPONSE
+        if cached is None or cached[0] != _STATE_VERSION:
+            data = self.load_data()
+            body = _json_dumps({
+                'study_time': data.get('study_time', 0),
+                'coins': data.get('coins', 0)
+            })
+            etag = f'"{_STATE_VERSION}-{data.get("study_time", 0)}"'
+            cached = _CACHED_TIMER_RESPONSE = (_STATE_VERSION, etag, body)
+
+        _, etag, body = cached
+        # Pollers that already have this state get a bodyless 304
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_json_bytes(body, etag)
+
+    def stream_events(self) -> None:
+        """API: Server-Sent Events stream of coin/study-time changes
+
+        Each connected client holds one thread that blocks on the state
+        condition, so events go out only when state actually changes
+        (plus a comment ping every 30 s to keep proxies from timing the
+        stream out). This replaces the clients' fixed 30-second polling.
+        """
+        # The stream never ends, so this connection can't be reused
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        last_version = -1
+        try:
+            while True:
+                with _SSE_CONDITION:
+                    _SSE_CONDITION.wait_for(
+                        lambda: _STATE_VERSION != last_version, timeout=30)
+                version = _STATE_VERSION
+                if version == last_version:
+                    # Idle timeout: keep the connection warm
+                    self.wfile.write(b': keep-alive\n\n')
+                else:
+                    data = self.load_data()
+                    payload = _json_dumps({
+                        'coins': data.get('coins', 0),
+                        'study_time': data.get('study_time', 0)
+                    })
+                    self.wfile.write(b'data: ' + payload + b'\n\n')
+                    last_version = version
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            # Client went away; the thread just winds down
+            return
+
+    def update_coins(self) -> None:
+        """API: Update coins via GET (for testing)"""
+        parsed_path = urlparse(self.path)
+        query_params = parse_qs(parsed_path.query)
+        
+        try:
+            if 'add' in query_params:
+                coins_to_add = int(query_params['add'][0])
+
+                def apply(state):
+                    state['coins'] = state.get('coins', 0) + coins_to_add
+                    state['last_updated'] = datetime.now().isoformat()
+
+                data = self.update_data(apply)
+
+                response = {
+                    'success': True,
+                    'coins': data['coins'],
+                    'added': coins_to_add
+                }
+            else:
+                response = {'success': False, 'error': 'No add parameter'}
+                
+        except Exception as e:
+            response = {'success': False, 'error': str(e)}
+        
+        self.send_json(response)
+    
+    def load_data(self) -> dict:
+        """Return the in-memory server state, loading it from the DB on first use"""
+        global _STATE
+        # Fast path: once loaded, skip the lock entirely (reads of a bound
+        # global are atomic; only first-time initialization needs the lock)
+        state = _STATE
+        if state is not None:
+            return state
+        with _STATE_LOCK:
+            if _STATE is None:
+                _STATE = dict(_get_db().execute('SELECT k, v FROM state'))
+            return _STATE
+
+    def update_data(self, mutator) -> dict:
+        """Atomically read-modify-write the shared state and mark it dirty
+
+        mutator receives the state dict and changes it in place; the
+        whole read-modify-write runs under the state lock so concurrent
+        updates can't lose increments.
+        """
+        global _STATE_VERSION
+        state = self.load_data()
+        with _STATE_LOCK:
+            mutator(state)
+            _STATE_DIRTY.set()
+            _STATE_VERSION += 1
+        with _SSE_CONDITION:
+            _SSE_CONDITION.notify_all()
+        # Coin counts are baked into cached pages, so drop them on every save
+        _PAGE_CACHE.clear()
+        _GZIP_CACHE.clear()
+        return state
+    
+    
+    
+    @staticmethod
+    def generate_registration_page(coins: int, study_hours: int, study_minutes: int) -> str:
+        """Generate enhanced registration page with server-side coin tracking"""
+        return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Study Challenge - Bimalism</title>
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap">
+    
+    <link rel="stylesheet" href="/static/common.css">
+    <link rel="stylesheet" href="/static/registration.css">
+</head>
+<body>
+    <div class="app-container">
+        <header class="app-header">
+            <a href="/" class="back-button">
+                <i class="fas fa-arrow-left"></i>
+            </a>
+            <div class="app-title">Study Challenge</div>
+        </header>
+        
+        <main class="page-content">
+            <!-- Coin Dashboard -->
+            <div class="coin-dashboard">
+                <div class="coin-stats">
+                    <div class="coin-info">
+                        <h3>Study Challenge Progress</h3>
+                        <div class="coin-value" id="coinValue">{coins}</div>
+                        <p>Coins Earned • {study_hours}h {study_minutes}m studied</p>
+                    </div>
+                    <div class="coin-icon">
+                        <i class="fas fa-coins"></i>
+                    </div>
+                </div>
+                
+                <div class="coin-progress">
+                    <div class="progress-label">
+                        <span>Progress to Goal</span>
+                        <span id="progressLabel">{coins}/30 Coins</span>
+                    </div>
+                    <div class="progress-bar">
+                        <div class="progress-fill" id="progressFill" style="--p: {coins/30:.4f}"></div>
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Timer Section -->
+            <div class="timer-section">
+                <h2><i class="fas fa-stopwatch"></i> Study Timer</h2>
+                <p>Track your study time and earn coins automatically</p>
+                
+                <div class="timer-display" id="timerDisplay">00:00:00</div>
+                
+                <div class="timer-controls">
+                    <button class="timer-btn btn-start" id="startTimer">
+                        <i class="fas fa-play"></i> Start
+                    </button>
+                    <button class="timer-btn btn-pause" id="pauseTimer">
+                        <i class="fas fa-pause"></i> Pause
+                    </button>
+                    <button class="timer-btn btn-reset" id="resetTimer">
+                        <i class="fas fa-redo"></i> Reset
+                    </button>
+                </div>
+            </div>
+            
+            <!-- Study Stats -->
+            <div class="study-stats">
+                <div class="stat-card">
+                    <div class="stat-value" id="totalTime">0h 0m</div>
+                    <div class="stat-label">Total Study Time</div>
+                </div>
+                
+                <div class="stat-card">
+                    <div class="stat-value" id="coinsEarned">{coins}</div>
+                    <div class="stat-label">Coins Earned</div>
+                </div>
+                
+                <div class="stat-card">
+                    <div class="stat-value" id="coinsNeeded">{30 - coins}</div>
+                    <div class="stat-label">Coins Needed</div>
+                </div>
+                
+                <div class="stat-card">
+                    <div class="stat-value" id="progressPercent">{((coins/30)*100):.1f}%</div>
+                    <div class="stat-label">Progress</div>
+                </div>
+            </div>
+            
+            <!-- Server Status -->
+            <div class="server-status">
+                <i class="fas fa-server"></i> 
+                <span class="status-connected">Connected to Server</span> • 
+                Coins and study time are being saved on the server
+            </div>
+            
+            <!-- Info Section -->
+            <div style="background: #f0f9ff; padding: 1.5rem; border-radius: 15px; margin-top: 2rem;">
+                <h3 style="color: #0369a1; margin-bottom: 1rem;">
+                    <i class="fas fa-info-circle"></i> How it Works
+                </h3>
+                <ul style="color: #4b5563; padding-left: 1.5rem;">
+                    <li style="margin-bottom: 0.5rem;">Start the timer when you begin studying</li>
+                    <li style="margin-bottom: 0.5rem;">Every 2 hours of study = 1 coin</li>
+                    <li style="margin-bottom: 0.5rem;">Reach 30 coins to get a special gift</li>
+                    <li>Your progress is saved on the server automatically</li>
+                </ul>
+            </div>
+        </main>
+    </div>
+    
+    <script>
+        // Timer variables (driven by a single requestAnimationFrame loop)
+        let studySeconds = 0;
+        let isTimerRunning = false;
+        let baseSeconds = 0;       // seconds banked before the current run
+        let startedAt = 0;         // wall-clock ms when the timer last started
+        let lastSaveTs = 0;
+        // Monotonic tag on every save so the server can drop duplicates;
+        // seeded from the clock so it stays monotonic across reloads
+        let SEQ = Date.now();
+        let totalStudySeconds = {study_hours * 3600 + study_minutes * 60};
+        
+        // DOM references, looked up once instead of per tick; setText
+        // compares before writing so unchanged text never forces the
+        // browser to re-process it
+        const el = {{
+            timer: document.getElementById('timerDisplay'),
+            total: document.getElementById('totalTime'),
+            coin: document.getElementById('coinValue'),
+            earned: document.getElementById('coinsEarned'),
+            needed: document.getElementById('coinsNeeded'),
+            label: document.getElementById('progressLabel'),
+            pct: document.getElementById('progressPercent'),
+            fill: document.getElementById('progressFill')
+        }};
+        
+        function setText(node, s) {{
+            if (node.textContent !== s) {{
+                node.textContent = s;
+            }}
+        }}
+        
+        // Update timer display
+        function updateTimerDisplay() {{
+            const hours = Math.floor(studySeconds / 3600);
+            const minutes = Math.floor((studySeconds % 3600) / 60);
+            const seconds = studySeconds % 60;
+            
+            setText(el.timer,
+                `${{hours.toString().padStart(2, '0')}}:${{minutes.toString().padStart(2, '0')}}:${{seconds.toString().padStart(2, '0')}}`);
+        }}
+        
+        // Update total time display
+        function updateTotalTimeDisplay() {{
+            const totalHours = Math.floor(totalStudySeconds / 3600);
+            const totalMinutes = Math.floor((totalStudySeconds % 3600) / 60);
+            setText(el.total, `${{totalHours}}h ${{totalMinutes}}m`);
+        }}
+        
+        // Start timer
+        function startTimer() {{
+            if (!isTimerRunning) {{
+                isTimerRunning = true;
+                baseSeconds = studySeconds;
+                startedAt = Date.now();
+            }}
+        }}
+        
+        // Pause timer
+        function pauseTimer() {{
+            if (isTimerRunning) {{
+                isTimerRunning = false;
+                saveStudyTime();
+            }}
+        }}
+        
+        // Reset timer
+        function resetTimer() {{
+            pauseTimer();
+            studySeconds = 0;
+            baseSeconds = 0;
+            updateTimerDisplay();
+            saveStudyTime();
+        }}
+        
+        // Save study time to server
+        function saveStudyTime() {{
+            const seconds = studySeconds;
+            // Zero the counter at dispatch, not on response: a beacon
+            // fired while this save is in flight must never read (and
+            // re-send) the same unsaved seconds
+            studySeconds = 0;
+            baseSeconds = 0;
+            startedAt = Date.now();
+            updateTimerDisplay();
+            fetch('/api/update_coins', {{
+                method: 'POST',
+                headers: {{
+                    'Content-Type': 'application/json',
+                }},
+                body: JSON.stringify({{
+                    action: 'update_timer',
+                    study_seconds: seconds,
+                    seq: ++SEQ
+                }})
+            }})
+            .then(response => response.json())
+            .then(data => {{
+                if (data.success) {{
+                    // Update display with server data
+                    updateCoinDisplay(data.coins, data.study_time);
+                }}
+            }})
+            .catch(error => console.error('Error saving study time:', error));
+        }}
+        
+        // Last values shown, diffed so overlapping save responses and
+        // pushed events carrying the same numbers skip the DOM entirely
+        let shownCoins = -1;
+        let shownStudyTime = -1;
+        
+        // Update coin display
+        function updateCoinDisplay(coins, studyTime) {{
+            if (coins === shownCoins && studyTime === shownStudyTime) {{
+                return;
+            }}
+            const coinsChanged = coins !== shownCoins;
+            shownCoins = coins;
+            shownStudyTime = studyTime;
+            totalStudySeconds = studyTime;
+            
+            if (coinsChanged) {{
+                // All coin-derived displays, written once per coin change
+                setText(el.coin, String(coins));
+                setText(el.earned, String(coins));
+                setText(el.needed, String(30 - coins));
+                setText(el.label, coins + '/30 Coins');
+                setText(el.pct, ((coins/30)*100).toFixed(1) + '%');
+                
+                // Update progress bar (scaleX via custom property, no relayout)
+                el.fill.style.setProperty('--p', (coins / 30).toFixed(4));
+                
+                // Check if reached goal
+                if (coins >= 30) {{
+                    showCongratulations();
+                }}
+            }}
+            
+            // Update total time
+            updateTotalTimeDisplay();
+        }}
+        
+        // Show congratulations message
+        function showCongratulations() {{
+            const congratMsg = document.createElement('div');
+            congratMsg.style.cssText = `
+                position: fixed;
+                top: 50%;
+                left: 50%;
+                transform: translate(-50%, -50%);
+                background: linear-gradient(135deg, #10b981, #059669);
+                color: white;
+                padding: 2rem;
+                border-radius: 20px;
+                box-shadow: 0 20px 40px rgba(0,0,0,0.3);
+                z-index: 10000;
+                text-align: center;
+                animation: fadeIn 0.5s ease;
+            `;
+            congratMsg.innerHTML = `
+                <div style="font-size: 3rem; margin-bottom: 1rem;">🎉</div>
+                <h2 style="font-size: 1.8rem; margin-bottom: 0.5rem;">CONGRATULATIONS!</h2>
+                <p style="margin-bottom: 1.5rem;">You've reached 30 coins! 🎁</p>
+                <button onclick="this.parentElement.remove()" style="padding: 0.8rem 1.5rem; background: white; color: #10b981; border: none; border-radius: 25px; font-weight: bold; cursor: pointer;">
+                    Continue Studying
+                </button>
+            `;
+            document.body.appendChild(congratMsg);
+        }}
+        
+        // Event listeners
+        document.getElementById('startTimer').addEventListener('click', startTimer);
+        document.getElementById('pauseTimer').addEventListener('click', pauseTimer);
+        document.getElementById('resetTimer').addEventListener('click', resetTimer);
+        
+        // Flat low-fi styles on devices with little memory or few cores
+        if ((navigator.deviceMemory || 8) < 4 || (navigator.hardwareConcurrency || 8) <= 2) {{
+            document.body.classList.add('low-fi');
+        }}
+        
+        // Initial setup
+        updateTimerDisplay();
+        updateTotalTimeDisplay();
+        
+        // Server pushes coin changes over one long-lived stream; the
+        // first event carries current state, so no initial fetch needed
+        const es = new EventSource('/api/events');
+        es.onmessage = e => {{
+            const d = JSON.parse(e.data);
+            updateCoinDisplay(d.coins, d.study_time);
+        }};
+        
+        // Auto-save when the tab is hidden or closing: sendBeacon is
+        // fire-and-forget and survives unload, where a fetch would
+        // often be cancelled by the browser
+        document.addEventListener('visibilitychange', function() {{
+            if (document.visibilityState === 'hidden' && studySeconds > 0) {{
+                const body = new Blob([JSON.stringify({{
+                    action: 'update_timer',
+                    study_seconds: studySeconds,
+                    seq: ++SEQ
+                }})], {{ type: 'application/json' }});
+                navigator.sendBeacon('/api/update_coins', body);
+                // The beacon will land; don't count these seconds again
+                studySeconds = 0;
+                baseSeconds = 0;
+                startedAt = Date.now();
+            }}
+        }});
+        
+        // One rAF-driven tick loop replaces the separate 1 s display
+        // and 60 s save intervals: fewer wakeups, automatic throttling
+        // in background tabs, and the timer display is only touched
+        // when the elapsed second actually changes
+        function tick(ts) {{
+            if (isTimerRunning) {{
+                const s = baseSeconds + Math.floor((Date.now() - startedAt) / 1000);
+                if (s !== studySeconds) {{
+                    studySeconds = s;
+                    updateTimerDisplay();
+                }}
+                if (ts - lastSaveTs >= 60000) {{
+                    lastSaveTs = ts;
+                    saveStudyTime();
+                }}
+            }}
+            requestAnimationFrame(tick);
+        }}
+        requestAnimationFrame(tick);
+    </script>
+</body>
+</html>'''
+    
+    def wrap_in_app_layout(self, content: str, title: str) -> bytes:
+        """Wrap content in the app layout; the chrome is memoized per title"""
+        pre, post = _layout_chrome(title)
+        return b''.join([pre, content.encode('utf-8'), post])
+
+
+@functools.lru_cache(maxsize=64)
+def _layout_chrome(title: str) -> tuple:
+    """Chrome bytes before and after the page content for a given title
+
+    The menu serves the same dozen or so titles over and over, so the
+    splice of title into the layout fragments is done once per title.
+    """
+    title_bytes = title.encode('utf-8')
+    p0, p1, p2, p3, p4 = _LAYOUT_PARTS
+    return (b''.join([p0, title_bytes, p1, title_bytes, p2]),
+            b''.join([p3, title_bytes, p4]))
+
+
+@functools.lru_cache(maxsize=256)
+def _registration_page_bytes(coins: int, study_hours: int, study_minutes: int) -> bytes:
+    """Build (and memoize) the encoded registration page for a given state
+
+    The page is a pure function of its arguments, so entries never go
+    stale; the LRU bound just caps memory.
+    """
+    page = BimalismServer.generate_registration_page(coins, study_hours, study_minutes)
+    return page.encode('utf-8')
+
+def start_server():
+    """Start the Bimalism server"""
+    print("=" * 70)
+    print("🚀 BIMALISM SERVER WITH CLEAN HAMBURGER MENU")
+    print("=" * 70)
+    print("✨ FEATURES:")
+    print("   • Clean header with only logo")
+    print("   • Hamburger menu in top-right corner")
+    print("   • Sidebar with ONLY requested items")
+    print("   • Server-side coin tracking")
+    print("")
+    print("📱 MENU INCLUDES ONLY:")
+    print("   • Home")
+    print("   • Bio Data")
+    print("   • Features")
+    print("   • NEET")
+    print("   • JEE")
+    print("   • Results")
+    print("   • Testimonials")
+    print("   • Game")
+    print("   • Study Challenge (with coins)")
+    print("   • Study Resources")
+    print("   • Calculator")
+    print("   • Settings")
+    print("   • Download App")
+    print("")
+    print("💰 COIN TRACKING:")
+    print("   • Study timer saves to server")
+    print("   • 2 hours = 1 coin (auto-calculated)")
+    print(f"   • Data stored in: {DB_FILE}")
+    print("")
+    print(f"🌐 Access at: http://localhost:{PORT}")
+    print("=" * 70)
+    
+    # Initialize the state database (imports old bimalism_data.json once)
+    _get_db()
+    print(f"📁 State database: {DB_FILE}")
+
+    # Flush in-memory state to disk periodically and on shutdown
+    threading.Thread(target=_state_flusher, daemon=True).start()
+    atexit.register(_flush_state)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    try:
+        webbrowser.open(f"http://localhost:{PORT}")
+    except:
+        pass
+    
+    with http.server.ThreadingHTTPServer(("", PORT), BimalismServer) as httpd:
+        try:
+            print(f"✅ Server started on port {PORT}")
+            print("🍔 Click the hamburger menu (top-right) for navigation")
+            print("📱 Menu shows ONLY the requested items")
+            print("⏰ Go to /registration to start the study timer")
+            print("🔄 Press Ctrl+C to stop server")
+            print("=" * 70)
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Server stopped")
+            print("✨ Thank you for using Bimalism!")
+
+if __name__ == "__main__":
     start_server()
\ No newline at end of file